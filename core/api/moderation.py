@@ -10,6 +10,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 import logging
 
 from core.models import Discussion, Round, ModerationAction
@@ -167,36 +168,39 @@ def moderation_status(request, discussion_id):
     # Get escalation status
     escalation_status = MutualRemovalService.check_escalation(request.user, discussion)
 
-    # Get moderation history
-    moderation_history = []
-
-    # Actions where user was initiator
-    initiator_actions = ModerationAction.objects.filter(
-        discussion=discussion, initiator=request.user
-    ).select_related("round_occurred", "target")
-
-    # Actions where user was target
-    target_actions = ModerationAction.objects.filter(
-        discussion=discussion, target=request.user
-    ).select_related("round_occurred", "initiator")
-
-    all_actions = list(initiator_actions) + list(target_actions)
-    all_actions.sort(key=lambda x: x.action_at, reverse=True)
-
-    for action in all_actions:
-        moderation_history.append(
-            {
-                "id": str(action.id),
-                "action_type": action.action_type,
-                "initiator": str(action.initiator.id),
-                "initiator_username": action.initiator.username,
-                "target": str(action.target.id),
-                "target_username": action.target.username,
-                "created_at": action.action_at.isoformat(),
-                "round_number": action.round_occurred.round_number,
-                "is_permanent": action.is_permanent,
-            }
+    # Get moderation history: actions where user was initiator or target,
+    # newest first, fetched as plain rows with the related columns joined in
+    all_actions = (
+        ModerationAction.objects.filter(discussion=discussion)
+        .filter(Q(initiator=request.user) | Q(target=request.user))
+        .order_by("-action_at")
+        .values(
+            "id",
+            "action_type",
+            "initiator_id",
+            "initiator__username",
+            "target_id",
+            "target__username",
+            "action_at",
+            "round_occurred__round_number",
+            "is_permanent",
         )
+    )
+
+    moderation_history = [
+        {
+            "id": str(action["id"]),
+            "action_type": action["action_type"],
+            "initiator": str(action["initiator_id"]),
+            "initiator_username": action["initiator__username"],
+            "target": str(action["target_id"]),
+            "target_username": action["target__username"],
+            "created_at": action["action_at"].isoformat(),
+            "round_number": action["round_occurred__round_number"],
+            "is_permanent": action["is_permanent"],
+        }
+        for action in all_actions
+    ]
 
     return Response(
         {
@@ -8,7 +8,10 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
+from django.db import transaction
+from django.db.models import Count, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 import logging
@@ -18,11 +21,23 @@ from core.services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
 
+# Membership sets for per-item validation; the service keeps the ordered lists.
+NOTIFICATION_TYPES = frozenset(NotificationService.ALL_NOTIFICATION_TYPES)
+CRITICAL_NOTIFICATION_TYPES = frozenset(NotificationService.CRITICAL_NOTIFICATIONS)
+
+
+class NotificationPagination(CursorPagination):
+    """
+    Keyset pagination over (created_at, id), newest first.
+
+    Pages are fetched with a range predicate on the (user, created_at, id)
+    index instead of OFFSET. The total count is computed by the view.
+    """
 
-class NotificationPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+    ordering = ("-created_at", "-id")
 
 
 @api_view(["GET"])
@@ -31,11 +46,15 @@ def list_notifications(request):
     """
     Get user's notifications.
 
-    GET /api/notifications/?page=1&page_size=20&unread_only=false
+    GET /api/notifications/?cursor=<opaque>&page_size=20&unread_only=false&discussion_id=42
+
+    Pages are addressed by the opaque cursor in "next"/"previous"; ?page=N is
+    no longer accepted. "count" is the total number of notifications matching
+    the filters, as under the old page-number pagination.
 
     Response:
         {
-            "count": 50,
+            "count": 42,
             "next": "...",
             "previous": "...",
             "unread_count": 5,
@@ -54,20 +73,61 @@ def list_notifications(request):
         }
     """
     unread_only = request.query_params.get("unread_only", "false").lower() == "true"
-
-    # Get notifications
-    notifications = NotificationLog.objects.filter(user=request.user)
+    discussion_id = request.query_params.get("discussion_id")
+
+    # Get notifications, loading only the columns serialized below
+    notifications = NotificationLog.objects.filter(user=request.user).only(
+        "id",
+        "notification_type",
+        "title",
+        "message",
+        "context",
+        "created_at",
+        "read",
+        "is_critical",
+    )
 
     if unread_only:
         notifications = notifications.filter(read=False)
 
-    # Get unread count
-    unread_count = NotificationLog.objects.filter(user=request.user, read=False).count()
+    if discussion_id:
+        # Notification context stores discussion ids as strings
+        notifications = notifications.filter(context__discussion_id=discussion_id)
+
+    # Carry the filtered total and the unread count on every row as
+    # uncorrelated subqueries, so the page and the counts come back in one
+    # round-trip. A window count would only see rows past the cursor.
+    total = (
+        notifications.order_by()
+        .values("user")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    unread = (
+        NotificationLog.objects.filter(user=request.user, read=False)
+        .values("user")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    notifications = notifications.annotate(
+        total_count=Coalesce(Subquery(total), 0),
+        unread_count=Coalesce(Subquery(unread), 0),
+    )
 
     # Paginate
     paginator = NotificationPagination()
     paginated_notifications = paginator.paginate_queryset(notifications, request)
 
+    if paginated_notifications:
+        total_count = paginated_notifications[0].total_count
+        unread_count = paginated_notifications[0].unread_count
+    else:
+        # Past the last row the subqueries never ran
+        total_count = notifications.count()
+        unread_count = NotificationLog.objects.filter(
+            user=request.user, read=False
+        ).count()
+
     # Serialize
     notifications_data = []
     for notif in paginated_notifications:
@@ -84,8 +144,17 @@ def list_notifications(request):
             }
         )
 
-    return paginator.get_paginated_response(
-        {"unread_count": unread_count, "notifications": notifications_data}
+    # Same envelope as the old page-number response, count included
+    return Response(
+        {
+            "count": total_count,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+            "results": {
+                "unread_count": unread_count,
+                "notifications": notifications_data,
+            },
+        }
     )
 
 
@@ -170,9 +239,7 @@ def get_notification_preferences(request):
 
     preferences_data = []
     for pref in preferences:
-        is_critical = (
-            pref.notification_type in NotificationService.CRITICAL_NOTIFICATIONS
-        )
+        is_critical = pref.notification_type in CRITICAL_NOTIFICATION_TYPES
 
         preferences_data.append(
             {
@@ -186,6 +253,16 @@ def get_notification_preferences(request):
     return Response({"preferences": preferences_data}, status=status.HTTP_200_OK)
 
 
+def _existing_preferences(user, notification_types):
+    """Map notification_type -> the user's stored preference, in one query."""
+    return {
+        pref.notification_type: pref
+        for pref in NotificationPreference.objects.filter(
+            user=user, notification_type__in=notification_types
+        )
+    }
+
+
 @api_view(["PATCH"])
 @permission_classes([IsAuthenticated])
 def update_notification_preferences(request):
@@ -214,6 +291,9 @@ def update_notification_preferences(request):
             "success": true,
             "updated_count": 1
         }
+
+    updated_count is the number of valid entries received. Several entries
+    for the same type are merged in order, later fields winning.
     """
     preferences_to_update = request.data.get("preferences", [])
 
@@ -222,29 +302,41 @@ def update_notification_preferences(request):
             {"error": "preferences must be a list"}, status=status.HTTP_400_BAD_REQUEST
         )
 
+    # Merge entries per valid type; later entries override earlier fields,
+    # matching the old apply-each-entry-in-order behaviour
+    requested = {}
     updated_count = 0
-
     for pref_data in preferences_to_update:
         notification_type = pref_data.get("type")
         if not notification_type:
             continue
 
         # Check if notification type is valid
-        if notification_type not in NotificationService.ALL_NOTIFICATION_TYPES:
+        if notification_type not in NOTIFICATION_TYPES:
             continue
 
-        # Get or create preference
-        preference, created = NotificationPreference.objects.get_or_create(
-            user=request.user,
-            notification_type=notification_type,
-            defaults={
-                "enabled": True,
-                "delivery_method": {"in_app": True, "email": False, "push": False},
-            },
-        )
+        requested.setdefault(notification_type, {}).update(pref_data)
+        updated_count += 1
+
+    existing = _existing_preferences(request.user, requested)
+    to_create = []
+    to_update = []
+
+    for notification_type, pref_data in requested.items():
+        preference = existing.get(notification_type)
+        if preference is None:
+            preference = NotificationPreference(
+                user=request.user,
+                notification_type=notification_type,
+                enabled=True,
+                delivery_method={"in_app": True, "email": False, "push": False},
+            )
+            to_create.append(preference)
+        else:
+            to_update.append(preference)
 
         # Update enabled status (only for optional notifications)
-        if notification_type not in NotificationService.CRITICAL_NOTIFICATIONS:
+        if notification_type not in CRITICAL_NOTIFICATION_TYPES:
             if "enabled" in pref_data:
                 preference.enabled = pref_data["enabled"]
 
@@ -253,16 +345,30 @@ def update_notification_preferences(request):
             new_delivery = pref_data["delivery_methods"]
 
             # For critical notifications, in_app is always True
-            if notification_type in NotificationService.CRITICAL_NOTIFICATIONS:
+            if notification_type in CRITICAL_NOTIFICATION_TYPES:
                 new_delivery["in_app"] = True
 
             preference.delivery_method = new_delivery
 
-        preference.save()
-        updated_count += 1
+    with transaction.atomic():
+        if to_create:
+            # A concurrent request (or default seeding) may insert the same
+            # type between the SELECT above and here; upsert instead of
+            # failing on unique_together(user, notification_type).
+            NotificationPreference.objects.bulk_create(
+                to_create,
+                update_conflicts=True,
+                unique_fields=["user", "notification_type"],
+                update_fields=["enabled", "delivery_method"],
+            )
+        if to_update:
+            NotificationPreference.objects.bulk_update(
+                to_update, ["enabled", "delivery_method"]
+            )
 
     return Response(
-        {"success": True, "updated_count": updated_count}, status=status.HTTP_200_OK
+        {"success": True, "updated_count": updated_count},
+        status=status.HTTP_200_OK,
     )
 
 
@@ -411,7 +517,17 @@ def list_devices(request):
             ]
         }
     """
-    devices = request.user.devices.filter(is_active=True)
+    # The related manager attaches request.user to each row, which reads
+    # user_id -- keep it loaded or every device costs a deferred fetch.
+    devices = request.user.devices.filter(is_active=True).only(
+        "id",
+        "user",
+        "device_type",
+        "device_name",
+        "is_active",
+        "last_used",
+        "created_at",
+    )
     
     device_list = [
         {
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_make_voting_credits_awarded_nullable"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"], name="notif_user_created_id_idx"
+            ),
+        ),
+    ]
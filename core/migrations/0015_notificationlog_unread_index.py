@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_notificationlog_cursor_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(
+                fields=["user", "read", "-created_at"],
+                name="notif_user_read_created_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="notificationlog",
+            name="notificatio_user_id_775a86_idx",
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:44
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0015_notificationlog_unread_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(
+                models.F("user"),
+                django.db.models.fields.json.KeyTransform("discussion_id", "context"),
+                name="notif_user_discussion_idx",
+            ),
+        ),
+    ]
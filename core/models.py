@@ -6,6 +6,8 @@ responses, voting, moderation, and platform configuration.
 """
 
 from django.db import models
+from django.db.models import F
+from django.db.models.fields.json import KeyTransform
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -101,12 +103,16 @@ class User(AbstractUser):
         """
         if invite_type == "platform":
             if self.platform_invites_banked <= 0:
-                raise ValidationError("No platform invites available")
+                raise ValidationError(
+                    "No platform invites available", code="no_platform_invites"
+                )
             self.platform_invites_used += 1
             self.platform_invites_banked -= 1
         elif invite_type == "discussion":
             if self.discussion_invites_banked <= 0:
-                raise ValidationError("No discussion invites available")
+                raise ValidationError(
+                    "No discussion invites available", code="no_discussion_invites"
+                )
             self.discussion_invites_used += 1
             self.discussion_invites_banked -= 1
         else:
@@ -571,19 +577,22 @@ class Round(models.Model):
         # Get response times based on configuration scope
         if config.mrp_calculation_scope == "current_round":
             response_times = self.get_response_times()
-        elif config.mrp_calculation_scope == "last_X_rounds":
-            # Get last X rounds including current
-            rounds = self.discussion.rounds.filter(
-                round_number__lte=self.round_number
-            ).order_by("-round_number")[: config.mrp_calculation_x_rounds]
-            response_times = []
-            for round in rounds:
-                response_times.extend(round.get_response_times())
-        else:  # all_rounds
-            rounds = self.discussion.rounds.filter(round_number__lte=self.round_number)
-            response_times = []
-            for round in rounds:
-                response_times.extend(round.get_response_times())
+        else:
+            rounds = Round.objects.filter(
+                discussion_id=self.discussion_id, round_number__lte=self.round_number
+            )
+            if config.mrp_calculation_scope == "last_X_rounds":
+                # Get last X rounds including current
+                rounds = rounds.order_by("-round_number")[
+                    : config.mrp_calculation_x_rounds
+                ]
+            # One query across all rounds in scope rather than one per round
+            response_times = list(
+                Response.objects.filter(
+                    round__in=rounds.values("pk"),
+                    time_since_previous_minutes__isnull=False,
+                ).values_list("time_since_previous_minutes", flat=True)
+            )
 
         if not response_times:
             # No response times yet, use default
@@ -1135,8 +1144,21 @@ class NotificationLog(models.Model):
     class Meta:
         db_table = "notification_logs"
         indexes = [
-            models.Index(fields=["user", "read", "created_at"]),
+            models.Index(
+                fields=["user", "read", "-created_at"],
+                name="notif_user_read_created_idx",
+            ),
             models.Index(fields=["user", "notification_type"]),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notif_user_created_id_idx",
+            ),
+            # Backs the list endpoint's ?discussion_id= filter
+            models.Index(
+                F("user"),
+                KeyTransform("discussion_id", "context"),
+                name="notif_user_discussion_idx",
+            ),
         ]
         ordering = ["-created_at"]
 
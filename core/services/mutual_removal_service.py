@@ -42,19 +42,19 @@ class MutualRemovalService:
         Returns:
             Tuple of (can_remove, reason_if_not)
         """
-        # Get participant records
-        try:
-            initiator_participant = DiscussionParticipant.objects.get(
-                discussion=discussion, user=initiator
+        # Get both participant records in one query
+        participants = {
+            p.user_id: p
+            for p in DiscussionParticipant.objects.filter(
+                discussion=discussion, user__in=[initiator, target]
             )
-        except DiscussionParticipant.DoesNotExist:
+        }
+        initiator_participant = participants.get(initiator.id)
+        if initiator_participant is None:
             return False, "Initiator is not a participant in this discussion"
 
-        try:
-            target_participant = DiscussionParticipant.objects.get(
-                discussion=discussion, user=target
-            )
-        except DiscussionParticipant.DoesNotExist:
+        target_participant = participants.get(target.id)
+        if target_participant is None:
             return False, "Target is not a participant in this discussion"
 
         # Both must be active participants
@@ -70,17 +70,13 @@ class MutualRemovalService:
         
         # NEW RULE: Both must have posted in current round before kamikaze can be used
         if current_round:
-            from core.models import Response
-            initiator_posted = Response.objects.filter(
-                round=current_round, user=initiator
-            ).exists()
-            target_posted = Response.objects.filter(
-                round=current_round, user=target
-            ).exists()
-            
-            if not initiator_posted:
+            posted = MutualRemovalService._posted_user_ids(
+                current_round, initiator, target
+            )
+
+            if initiator.id not in posted:
                 return False, "You must post in the current round before using kamikaze"
-            if not target_posted:
+            if target.id not in posted:
                 return False, "Target must have posted in the current round"
 
         # Check if initiator already removed target in this discussion
@@ -103,6 +99,15 @@ class MutualRemovalService:
 
         return True, ""
 
+    @staticmethod
+    def _posted_user_ids(current_round: Round, *users: User) -> set:
+        """Return the ids of the given users who have a response in current_round."""
+        return set(
+            Response.objects.filter(round=current_round, user__in=users)
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+
     @staticmethod
     def get_removal_count(user: User, discussion: Discussion) -> int:
         """
@@ -171,20 +176,19 @@ class MutualRemovalService:
             raise ValidationError(reason)
 
         # Get participant records with select_for_update to prevent race conditions
-        initiator_participant = DiscussionParticipant.objects.select_for_update().get(
-            discussion=discussion, user=initiator
-        )
-        target_participant = DiscussionParticipant.objects.select_for_update().get(
-            discussion=discussion, user=target
-        )
+        participants = {
+            p.user_id: p
+            for p in DiscussionParticipant.objects.select_for_update().filter(
+                discussion=discussion, user__in=[initiator, target]
+            )
+        }
+        initiator_participant = participants[initiator.id]
+        target_participant = participants[target.id]
 
         # Check if either user has already posted in current round
-        initiator_posted = Response.objects.filter(
-            round=current_round, user=initiator
-        ).exists()
-        target_posted = Response.objects.filter(
-            round=current_round, user=target
-        ).exists()
+        posted = MutualRemovalService._posted_user_ids(current_round, initiator, target)
+        initiator_posted = initiator.id in posted
+        target_posted = target.id in posted
 
         # Move both to temporary observer
         initiator_participant.role = "temporary_observer"
@@ -368,27 +368,37 @@ class NotificationService:
             logger.error(f"Failed to send WebSocket notification: {e}")
 
     @staticmethod
-    @transaction.atomic
     def create_notification_preferences(user: User) -> None:
         """
         Create default notification preferences for new user.
 
+        Existing preferences are left untouched; only missing types are
+        inserted, in one statement.
+
         Args:
             user: User to create preferences for
         """
-        for notification_type in NotificationService.ALL_NOTIFICATION_TYPES:
-            is_critical = (
-                notification_type in NotificationService.CRITICAL_NOTIFICATIONS
+        existing = set(
+            NotificationPreference.objects.filter(user=user).values_list(
+                "notification_type", flat=True
             )
-
-            NotificationPreference.objects.get_or_create(
+        )
+        missing = [
+            NotificationPreference(
                 user=user,
                 notification_type=notification_type,
-                defaults={
-                    "enabled": is_critical,
-                    "delivery_method": {"in_app": True, "email": False, "push": False},
-                },
+                enabled=notification_type
+                in NotificationService.CRITICAL_NOTIFICATIONS,
+                delivery_method={"in_app": True, "email": False, "push": False},
             )
+            for notification_type in NotificationService.ALL_NOTIFICATION_TYPES
+            if notification_type not in existing
+        ]
+        if not missing:
+            return
+
+        # ignore_conflicts covers two concurrent callers seeding the same user
+        NotificationPreference.objects.bulk_create(missing, ignore_conflicts=True)
 
         logger.info(f"Notification preferences created for {user.username}")
 
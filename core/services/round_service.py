@@ -7,7 +7,9 @@ and handles round progression including Phase 1/2 transitions.
 
 import statistics
 from typing import Optional, List
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Aggregate, FloatField, Value
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from datetime import timedelta
 
@@ -20,6 +22,14 @@ from core.models import (
 )
 
 
+class _Median(Aggregate):
+    """PostgreSQL continuous median (interpolates between the two middle values)."""
+
+    function = "PERCENTILE_CONT"
+    template = "%(function)s(0.5) WITHIN GROUP (ORDER BY %(expressions)s)"
+    output_field = FloatField()
+
+
 class RoundService:
     """Round lifecycle management and MRP calculation."""
 
@@ -140,56 +150,54 @@ class RoundService:
         mrm = round.discussion.min_response_time_minutes
         rtm = round.discussion.response_time_multiplier
 
-        # Get response times based on scope
-        response_times = []
+        # Step 1: Select response times based on scope
+        responses = Response.objects.filter(time_since_previous_minutes__isnull=False)
 
         if config.mrp_calculation_scope == "current_round":
             # Only this round
-            times = list(
-                round.responses.filter(
-                    time_since_previous_minutes__isnull=False
-                ).values_list("time_since_previous_minutes", flat=True)
-            )
-            response_times.extend(times)
+            responses = responses.filter(round=round)
 
         elif config.mrp_calculation_scope == "last_X_rounds":
-            # Get last X rounds including current
+            # Last X rounds including current
             rounds = Round.objects.filter(
-                discussion=round.discussion, round_number__lte=round.round_number
+                discussion_id=round.discussion_id, round_number__lte=round.round_number
             ).order_by("-round_number")[: config.mrp_calculation_x_rounds]
-
-            for r in rounds:
-                times = list(
-                    r.responses.filter(
-                        time_since_previous_minutes__isnull=False
-                    ).values_list("time_since_previous_minutes", flat=True)
-                )
-                response_times.extend(times)
+            responses = responses.filter(round__in=rounds.values("pk"))
 
         else:  # 'all_rounds'
             # All rounds up to and including current
-            rounds = Round.objects.filter(
-                discussion=round.discussion, round_number__lte=round.round_number
+            responses = responses.filter(
+                round__discussion_id=round.discussion_id,
+                round__round_number__lte=round.round_number,
             )
 
-            for r in rounds:
-                times = list(
-                    r.responses.filter(
-                        time_since_previous_minutes__isnull=False
-                    ).values_list("time_since_previous_minutes", flat=True)
+        if connection.vendor == "postgresql":
+            # Steps 2-3 in the database: clamp to MRM and take the median
+            median_time = responses.aggregate(
+                median=_Median(
+                    Greatest(
+                        "time_since_previous_minutes",
+                        Value(float(mrm)),
+                        output_field=FloatField(),
+                    )
                 )
-                response_times.extend(times)
+            )["median"]
+        else:
+            response_times = list(
+                responses.values_list("time_since_previous_minutes", flat=True)
+            )
+            median_time = None
+            if response_times:
+                # Step 2: Adjust times - if t < MRM, set t = MRM
+                adjusted_times = [max(t, mrm) for t in response_times]
 
-        if not response_times:
+                # Step 3: Calculate median
+                median_time = statistics.median(adjusted_times)
+
+        if median_time is None:
             # No response times yet, use minimum MRP
             return float(mrm * rtm)
 
-        # Step 2: Adjust times - if t < MRM, set t = MRM
-        adjusted_times = [max(t, mrm) for t in response_times]
-
-        # Step 3: Calculate median
-        median_time = statistics.median(adjusted_times)
-
         # Step 4: MRP = median × RTM
         mrp = median_time * rtm
 
@@ -4,7 +4,7 @@ Test settings that inherit from base settings but use SQLite.
 
 from discussion_platform.settings import *
 
-# Override database to use SQLite for tests
+# Override database to use in-memory SQLite for tests (no disk IO or fsync)
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
@@ -156,14 +156,16 @@ def api_client():
 
 @pytest.fixture
 def authenticated_client(user_factory):
-    """Provide authenticated API client with user."""
+    """Provide authenticated API client with user.
+
+    Uses force_authenticate rather than a JWT so requests skip token
+    issuance and the per-request user lookup.
+    """
     from rest_framework.test import APIClient
-    from rest_framework_simplejwt.tokens import RefreshToken
 
     user = user_factory()
     client = APIClient()
-    refresh = RefreshToken.for_user(user)
-    client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}")
+    client.force_authenticate(user=user)
     client.user = user
 
     return client
@@ -2,10 +2,14 @@
 Factory boy factories for test data generation.
 """
 
+from datetime import timedelta
+
 import factory
 from factory.django import DjangoModelFactory
 from faker import Faker
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
 from core.models import (
     PlatformConfig,
     Discussion,
@@ -20,6 +24,7 @@ from core.models import (
     ResponseEdit,
     DraftResponse,
     NotificationPreference,
+    NotificationLog,
 )
 
 fake = Faker()
@@ -96,6 +101,25 @@ class ResponseFactory(DjangoModelFactory):
     content = factory.Faker("paragraph", nb_sentences=3)
     character_count = factory.LazyAttribute(lambda obj: len(obj.content))
 
+    @classmethod
+    def create_with_times(cls, round, times, users):
+        """
+        Insert one response per time gap with a single bulk_create.
+
+        Authors cycle through ``users``. Response.save() is bypassed, so
+        character_count comes from the factory's LazyAttribute.
+        """
+        return Response.objects.bulk_create(
+            [
+                cls.build(
+                    round=round,
+                    user=users[i % len(users)],
+                    time_since_previous_minutes=time,
+                )
+                for i, time in enumerate(times)
+            ]
+        )
+
 
 class VoteFactory(DjangoModelFactory):
     class Meta:
@@ -178,3 +202,69 @@ class NotificationPreferenceFactory(DjangoModelFactory):
     notification_type = "new_response"
     enabled = True
     delivery_method = {"email": True, "push": True, "in_app": True}
+
+
+class NotificationLogFactory(DjangoModelFactory):
+    class Meta:
+        model = NotificationLog
+
+    user = factory.SubFactory(UserFactory)
+    notification_type = "new_response_posted"
+    title = factory.Sequence(lambda n: f"Notification {n}")
+    message = "Test"
+
+    @classmethod
+    def seed(cls, user, n, read=False):
+        """
+        Insert ``n`` notifications for ``user`` with one raw INSERT.
+
+        For setup-only rows: no model instances are built, and values go
+        through each field's own DB preparation so the SQL stays portable.
+        Rows are a second apart, newest first, so ordering by created_at
+        never ties.
+        """
+        if not n:
+            return
+
+        now = timezone.now()
+        names = (
+            "user",
+            "notification_type",
+            "title",
+            "message",
+            "context",
+            "created_at",
+            "read",
+            "read_at",
+            "is_critical",
+        )
+        rows = [
+            {
+                "user": user.pk,
+                "notification_type": "new_response_posted",
+                "title": f"Notification {i}",
+                "message": "Test",
+                "context": {},
+                "created_at": now - timedelta(seconds=i),
+                "read": read,
+                "read_at": now if read else None,
+                "is_critical": False,
+            }
+            for i in range(n)
+        ]
+        fields = [NotificationLog._meta.get_field(name) for name in names]
+        params = [
+            field.get_db_prep_save(row[field.name], connection)
+            for row in rows
+            for field in fields
+        ]
+
+        quote = connection.ops.quote_name
+        row = "(" + ", ".join(["%s"] * len(fields)) + ")"
+        sql = "INSERT INTO {} ({}) VALUES {}".format(
+            quote(NotificationLog._meta.db_table),
+            ", ".join(quote(field.column) for field in fields),
+            ", ".join([row] * n),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
@@ -481,7 +481,12 @@ class TestRoundModel:
         assert mrp == 100
 
     def test_calculate_mrp_last_x_rounds(
-        self, discussion_factory, round_factory, user_factory, config
+        self,
+        discussion_factory,
+        round_factory,
+        user_factory,
+        config,
+        django_assert_num_queries,
     ):
         """Test MRP calculation over last X rounds."""
         config.mrp_calculation_scope = "last_X_rounds"
@@ -526,7 +531,9 @@ class TestRoundModel:
                 time_since_previous_minutes=time,
             )
 
-        mrp = round3.calculate_mrp(config)
+        # Responses from every round in scope are fetched together
+        with django_assert_num_queries(1):
+            mrp = round3.calculate_mrp(config)
 
         # Times from rounds 2 and 3: [30, 40, 50, 60]
         # Median = 45
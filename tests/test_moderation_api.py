@@ -1,5 +1,6 @@
 """Tests for moderation API endpoints."""
 
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
 from rest_framework.test import APIClient
 from core.models import (
@@ -11,33 +12,38 @@ from core.models import (
 class TestMutualRemovalAPI(TestCase):
     """Tests for the mutual removal API endpoint."""
 
-    def setUp(self):
-        config = PlatformConfig.load()
-        self.client = APIClient()
-        self.initiator = User.objects.create_user(
-            username="initiator", phone_number="+15551111111", password="testpass123"
-        )
-        self.target = User.objects.create_user(
-            username="target", phone_number="+15552222222", password="testpass123"
-        )
-        self.discussion = Discussion.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = PlatformConfig.load()
+        # Tests authenticate with force_authenticate, so skip hashing entirely
+        password = make_password(None)
+        cls.initiator, cls.target = User.objects.bulk_create([
+            User(username="initiator", phone_number="+15551111111", password=password),
+            User(username="target", phone_number="+15552222222", password=password),
+        ])
+        cls.discussion = Discussion.objects.create(
             topic_headline="Test Discussion",
             topic_details="Details",
-            initiator=self.initiator,
-            max_response_length_chars=config.mrl_max_chars,
+            initiator=cls.initiator,
+            max_response_length_chars=cls.config.mrl_max_chars,
             response_time_multiplier=1.0,
-            min_response_time_minutes=config.mrm_min_minutes,
-        )
-        self.round = Round.objects.create(
-            discussion=self.discussion, round_number=1, status="in_progress"
-        )
-        DiscussionParticipant.objects.create(
-            discussion=self.discussion, user=self.initiator, role="initiator"
+            min_response_time_minutes=cls.config.mrm_min_minutes,
         )
-        DiscussionParticipant.objects.create(
-            discussion=self.discussion, user=self.target, role="active"
+        cls.round = Round.objects.create(
+            discussion=cls.discussion, round_number=1, status="in_progress"
         )
-        self.url = f"/api/discussions/{self.discussion.id}/mutual-removal/"
+        DiscussionParticipant.objects.bulk_create([
+            DiscussionParticipant(
+                discussion=cls.discussion, user=cls.initiator, role="initiator"
+            ),
+            DiscussionParticipant(
+                discussion=cls.discussion, user=cls.target, role="active"
+            ),
+        ])
+        cls.url = f"/api/discussions/{cls.discussion.id}/mutual-removal/"
+
+    def setUp(self):
+        self.client = APIClient()
 
     def test_requires_authentication(self):
         response = self.client.post(self.url, {"target_user_id": str(self.target.id)})
@@ -73,33 +79,38 @@ class TestMutualRemovalAPI(TestCase):
 class TestModerationStatusAPI(TestCase):
     """Tests for the moderation status API endpoint."""
 
-    def setUp(self):
-        config = PlatformConfig.load()
-        self.client = APIClient()
-        self.user = User.objects.create_user(
-            username="testuser", phone_number="+15551111111", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="otheruser", phone_number="+15552222222", password="testpass123"
-        )
-        self.discussion = Discussion.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = PlatformConfig.load()
+        # Tests authenticate with force_authenticate, so skip hashing entirely
+        password = make_password(None)
+        cls.user, cls.other_user = User.objects.bulk_create([
+            User(username="testuser", phone_number="+15551111111", password=password),
+            User(username="otheruser", phone_number="+15552222222", password=password),
+        ])
+        cls.discussion = Discussion.objects.create(
             topic_headline="Test",
             topic_details="Details",
-            initiator=self.user,
-            max_response_length_chars=config.mrl_max_chars,
+            initiator=cls.user,
+            max_response_length_chars=cls.config.mrl_max_chars,
             response_time_multiplier=1.0,
-            min_response_time_minutes=config.mrm_min_minutes,
-        )
-        self.round = Round.objects.create(
-            discussion=self.discussion, round_number=1, status="in_progress"
-        )
-        DiscussionParticipant.objects.create(
-            discussion=self.discussion, user=self.user, role="initiator"
+            min_response_time_minutes=cls.config.mrm_min_minutes,
         )
-        DiscussionParticipant.objects.create(
-            discussion=self.discussion, user=self.other_user, role="active"
+        cls.round = Round.objects.create(
+            discussion=cls.discussion, round_number=1, status="in_progress"
         )
-        self.url = f"/api/discussions/{self.discussion.id}/moderation-status/"
+        DiscussionParticipant.objects.bulk_create([
+            DiscussionParticipant(
+                discussion=cls.discussion, user=cls.user, role="initiator"
+            ),
+            DiscussionParticipant(
+                discussion=cls.discussion, user=cls.other_user, role="active"
+            ),
+        ])
+        cls.url = f"/api/discussions/{cls.discussion.id}/moderation-status/"
+
+    def setUp(self):
+        self.client = APIClient()
 
     def test_requires_authentication(self):
         response = self.client.get(self.url)
@@ -115,7 +126,8 @@ class TestModerationStatusAPI(TestCase):
 
     def test_active_participant_gets_status(self):
         self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url)
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
         assert response.status_code == 200
         data = response.json()
         assert "user_removal_count" in data
@@ -140,7 +152,26 @@ class TestModerationStatusAPI(TestCase):
             is_permanent=False,
         )
         self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url)
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
         data = response.json()
         assert len(data["moderation_history"]) == 1
         assert data["moderation_history"][0]["action_type"] == "mutual_removal"
+        assert data["moderation_history"][0]["target_username"] == "otheruser"
+        assert data["moderation_history"][0]["round_number"] == 1
+
+        # History size must not change the query count
+        ModerationAction.objects.bulk_create([
+            ModerationAction(
+                discussion=self.discussion,
+                initiator=self.other_user,
+                target=self.user,
+                action_type="mutual_removal",
+                round_occurred=self.round,
+                is_permanent=False,
+            )
+            for _ in range(20)
+        ])
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
+        assert len(response.json()["moderation_history"]) == 21
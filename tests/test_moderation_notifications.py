@@ -8,6 +8,7 @@ and integration with existing systems.
 import pytest
 from django.utils import timezone
 from datetime import timedelta
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 from core.models import (
@@ -25,40 +26,87 @@ from core.services.mutual_removal_service import MutualRemovalService
 from core.services.notification_service import NotificationService
 
 
+def _post_responses(round_obj, *posts):
+    """Insert one response per (user, content) pair with a single query."""
+    Response.objects.bulk_create([
+        Response(user=user, round=round_obj, content=content, character_count=len(content))
+        for user, content in posts
+    ])
+
+
+def _participants(discussion, *users):
+    """Fetch the given users' participant records with a single query."""
+    by_user = {
+        p.user_id: p
+        for p in DiscussionParticipant.objects.filter(
+            discussion=discussion, user__in=users
+        )
+    }
+    return [by_user[user.id] for user in users]
+
+
+@pytest.fixture
+def posted_round(user_factory, discussion_factory, round_factory):
+    """In-progress round where initiator user_a and active user_b have both posted."""
+    user_a = user_factory(username="user_a")
+    user_b = user_factory(username="user_b")
+    discussion = discussion_factory(initiator=user_a)
+    round_obj = round_factory(
+        discussion=discussion, round_number=1, status="in_progress"
+    )
+
+    # Create user_b's participant (initiator already exists from factory)
+    DiscussionParticipant.objects.create(
+        discussion=discussion, user=user_b, role="active"
+    )
+
+    # Both users must post before using kamikaze
+    _post_responses(round_obj, (user_a, "Response A"), (user_b, "Response B"))
+
+    return SimpleNamespace(
+        user_a=user_a, user_b=user_b, discussion=discussion, round=round_obj
+    )
+
+
+@pytest.fixture
+def escalation_discussion(user_factory, discussion_factory, round_factory):
+    """In-progress round with user_a as initiator and user_b/c/d active."""
+    user_a = user_factory(username="user_a")
+    user_b = user_factory(
+        username="user_b", platform_invites_acquired=5, platform_invites_banked=3
+    )
+    user_c = user_factory(username="user_c")
+    user_d = user_factory(username="user_d")
+
+    discussion = discussion_factory(initiator=user_a)
+    round_obj = round_factory(
+        discussion=discussion, round_number=1, status="in_progress"
+    )
+
+    # Create participants (user_a already exists as initiator from factory)
+    for user in [user_b, user_c, user_d]:
+        DiscussionParticipant.objects.create(
+            discussion=discussion, user=user, role="active"
+        )
+
+    return SimpleNamespace(
+        user_a=user_a,
+        user_b=user_b,
+        user_c=user_c,
+        user_d=user_d,
+        discussion=discussion,
+        round=round_obj,
+    )
+
+
 @pytest.mark.django_db
 class TestMutualRemoval:
     """Tests for mutual removal system"""
 
-    def test_mutual_removal_basic(
-        self, user_factory, discussion_factory, round_factory
-    ):
+    def test_mutual_removal_basic(self, posted_round):
         """Test basic mutual removal"""
-        user_a = user_factory(username="user_a")
-        user_b = user_factory(username="user_b")
-        discussion = discussion_factory(initiator=user_a)
-        round_obj = round_factory(
-            discussion=discussion, round_number=1, status="in_progress"
-        )
-
-        # Get/create participants (initiator already exists from factory)
-        participant_a = DiscussionParticipant.objects.get(
-            discussion=discussion, user=user_a
-        )
-        participant_b = DiscussionParticipant.objects.create(
-            discussion=discussion, user=user_b, role="active"
-        )
-
-        # Both users must post in current round before using kamikaze
-        Response.objects.create(
-            user=user_a,
-            round=round_obj,
-            content="Response from user A"
-        )
-        Response.objects.create(
-            user=user_b,
-            round=round_obj,
-            content="Response from user B"
-        )
+        user_a, user_b = posted_round.user_a, posted_round.user_b
+        discussion, round_obj = posted_round.discussion, posted_round.round
 
         # Execute mutual removal
         moderation_action = MutualRemovalService.initiate_removal(
@@ -69,8 +117,7 @@ class TestMutualRemoval:
         )
 
         # Verify both moved to temporary observer
-        participant_a.refresh_from_db()
-        participant_b.refresh_from_db()
+        participant_a, participant_b = _participants(discussion, user_a, user_b)
 
         assert participant_a.role == "temporary_observer"
         assert participant_b.role == "temporary_observer"
@@ -84,114 +131,61 @@ class TestMutualRemoval:
         assert moderation_action.initiator == user_a
         assert moderation_action.target == user_b
 
-    def test_mutual_removal_escalation_target(
-        self, user_factory, discussion_factory, round_factory
-    ):
-        """Test target becomes permanent after 3 removals"""
-        user_a = user_factory(username="user_a")
-        user_b = user_factory(
-            username="user_b", platform_invites_acquired=5, platform_invites_banked=3
-        )
-        user_c = user_factory(username="user_c")
-        user_d = user_factory(username="user_d")
-
-        discussion = discussion_factory(initiator=user_a)
-        round_obj = round_factory(
-            discussion=discussion, round_number=1, status="in_progress"
-        )
-
-        # Create participants (user_a already exists as initiator from factory)
-        for user in [user_b, user_c, user_d]:
-            DiscussionParticipant.objects.create(
-                discussion=discussion, user=user, role="active"
-            )
-
-        # Both users must post before using kamikaze
-        Response.objects.create(
-            user=user_a, round=round_obj, content="Response A"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B"
-        )
-
-        # First removal
-        MutualRemovalService.initiate_removal(user_a, user_b, discussion, round_obj)
+    def test_mutual_removal_escalation_target(self, escalation_discussion):
+        """Test target escalates to permanent observer on the 3rd removal"""
+        setup = escalation_discussion
         participant_b = DiscussionParticipant.objects.get(
-            discussion=discussion, user=user_b
-        )
-        assert participant_b.times_removed == 1
-
-        # Rejoin
-        participant_b.role = "active"
-        participant_b.save()
-
-        # Create responses for second kamikaze
-        Response.objects.create(
-            user=user_c, round=round_obj, content="Response C"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B2"
-        )
-
-        # Second removal
-        MutualRemovalService.initiate_removal(user_c, user_b, discussion, round_obj)
-        participant_b.refresh_from_db()
-        assert participant_b.times_removed == 2
-
-        # Rejoin
-        participant_b.role = "active"
-        participant_b.save()
-
-        # Create responses for third kamikaze
-        Response.objects.create(
-            user=user_d, round=round_obj, content="Response D"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B3"
-        )
-
-        # Third removal - becomes permanent
-        MutualRemovalService.initiate_removal(user_d, user_b, discussion, round_obj)
-        participant_b.refresh_from_db()
-        user_b.refresh_from_db()
-
-        assert participant_b.times_removed == 3
-        assert participant_b.role == "permanent_observer"
-        assert user_b.platform_invites_acquired == 0
-        assert user_b.platform_invites_banked == 0
+            discussion=setup.discussion, user=setup.user_b
+        )
+        # (remover, expected role, expected (acquired, banked) invites)
+        steps = [
+            (setup.user_a, "temporary_observer", (5, 3)),
+            (setup.user_c, "temporary_observer", (5, 3)),
+            (setup.user_d, "permanent_observer", (0, 0)),
+        ]
+
+        for count, (remover, expected_role, expected_invites) in enumerate(
+            steps, start=1
+        ):
+            if count > 1:
+                # Rejoin
+                DiscussionParticipant.objects.filter(pk=participant_b.pk).update(
+                    role="active"
+                )
+
+            # Both users must post before using kamikaze
+            _post_responses(
+                setup.round,
+                (remover, f"Response from {remover.username}"),
+                (setup.user_b, f"Response B{count}"),
+            )
+            MutualRemovalService.initiate_removal(
+                remover, setup.user_b, setup.discussion, setup.round
+            )
+            participant_b.refresh_from_db()
+            assert participant_b.times_removed == count
+            assert participant_b.role == expected_role
+            # Re-read from the database so the invite reset must be persisted
+            setup.user_b.refresh_from_db(
+                fields=["platform_invites_acquired", "platform_invites_banked"]
+            )
+            assert (
+                setup.user_b.platform_invites_acquired,
+                setup.user_b.platform_invites_banked,
+            ) == expected_invites
 
-    def test_cannot_remove_twice(self, user_factory, discussion_factory, round_factory):
+    def test_cannot_remove_twice(self, posted_round):
         """Test duplicate removal prevention"""
-        user_a = user_factory(username="user_a")
-        user_b = user_factory(username="user_b")
-        discussion = discussion_factory(initiator=user_a)
-        round_obj = round_factory(
-            discussion=discussion, round_number=1, status="in_progress"
-        )
-
-        # Get initiator (already exists) and create user_b
-        DiscussionParticipant.objects.create(
-            discussion=discussion, user=user_b, role="active"
-        )
-
-        # Both users must post before using kamikaze
-        Response.objects.create(
-            user=user_a, round=round_obj, content="Response A"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B"
-        )
+        user_a, user_b = posted_round.user_a, posted_round.user_b
+        discussion, round_obj = posted_round.discussion, posted_round.round
 
         # First removal
         MutualRemovalService.initiate_removal(user_a, user_b, discussion, round_obj)
 
         # Make both active again
-        for user in [user_a, user_b]:
-            participant = DiscussionParticipant.objects.get(
-                discussion=discussion, user=user
-            )
-            participant.role = "active"
-            participant.save()
+        DiscussionParticipant.objects.filter(
+            discussion=discussion, user__in=[user_a, user_b]
+        ).update(role="active")
 
         # Second attempt should fail
         can_remove, reason = MutualRemovalService.can_initiate_removal(
@@ -277,33 +271,14 @@ class TestNotifications:
             user=user, notification_type="new_response_posted"
         ).exists()
 
-    def test_mutual_removal_notifications(
-        self, user_factory, discussion_factory, round_factory
-    ):
+    def test_mutual_removal_notifications(self, posted_round):
         """Test mutual removal notifications"""
-        user_a = user_factory(username="user_a")
-        user_b = user_factory(username="user_b")
-        discussion = discussion_factory(initiator=user_a)
-        round_obj = round_factory(
-            discussion=discussion, round_number=1, status="in_progress"
-        )
-
-        # Get initiator (already exists) and create user_b
-        DiscussionParticipant.objects.create(
-            discussion=discussion, user=user_b, role="active"
-        )
+        user_a, user_b = posted_round.user_a, posted_round.user_b
+        discussion, round_obj = posted_round.discussion, posted_round.round
 
         for user in [user_a, user_b]:
             NotificationService.create_notification_preferences(user)
 
-        # Both users must post before using kamikaze
-        Response.objects.create(
-            user=user_a, round=round_obj, content="Response A"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B"
-        )
-
         # Execute mutual removal
         MutualRemovalService.initiate_removal(user_a, user_b, discussion, round_obj)
 
@@ -321,78 +296,57 @@ class TestIntegration:
     """Integration tests"""
 
     def test_moderation_notification_integration(
-        self, user_factory, discussion_factory, round_factory
+        self, escalation_discussion, django_assert_num_queries
     ):
         """End-to-end moderation and notification test"""
-        user_a = user_factory(username="user_a")
-        user_b = user_factory(username="user_b")
-        user_c = user_factory(username="user_c")
-        user_d = user_factory(username="user_d")
-
-        discussion = discussion_factory(initiator=user_a)
-        round_obj = round_factory(
-            discussion=discussion, round_number=1, status="in_progress"
+        setup = escalation_discussion
+        user_a, user_b, user_c, user_d = (
+            setup.user_a, setup.user_b, setup.user_c, setup.user_d
         )
-
-        # Create participants (user_a already exists as initiator from factory)
-        for user in [user_b, user_c, user_d]:
-            DiscussionParticipant.objects.create(
-                discussion=discussion, user=user, role="active"
-            )
+        discussion, round_obj = setup.discussion, setup.round
 
         # Create notification preferences for all users
         for user in [user_a, user_b, user_c, user_d]:
             NotificationService.create_notification_preferences(user)
 
         # Both users must post before using kamikaze
-        Response.objects.create(
-            user=user_a, round=round_obj, content="Response A"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B"
-        )
+        _post_responses(round_obj, (user_a, "Response A"), (user_b, "Response B"))
 
         # User A removes User B
-        MutualRemovalService.initiate_removal(user_a, user_b, discussion, round_obj)
-
-        # Check notifications
-        assert NotificationLog.objects.filter(
-            user=user_a, notification_type="mutual_removal_initiated"
-        ).exists()
-        assert NotificationLog.objects.filter(
-            user=user_b, notification_type="mutual_removal_initiated"
-        ).exists()
+        with django_assert_num_queries(27):
+            MutualRemovalService.initiate_removal(user_a, user_b, discussion, round_obj)
 
         # Check observer status
-        participant_a = DiscussionParticipant.objects.get(
-            discussion=discussion, user=user_a
-        )
-        participant_b = DiscussionParticipant.objects.get(
-            discussion=discussion, user=user_b
-        )
+        participant_a, participant_b = _participants(discussion, user_a, user_b)
         assert participant_a.role == "temporary_observer"
         assert participant_b.role == "temporary_observer"
 
         # Rejoin both
-        participant_a.role = "active"
-        participant_b.role = "active"
-        participant_a.save()
-        participant_b.save()
+        DiscussionParticipant.objects.filter(
+            pk__in=[participant_a.pk, participant_b.pk]
+        ).update(role="active")
 
         # Create responses for second kamikaze
-        Response.objects.create(
-            user=user_c, round=round_obj, content="Response C"
-        )
-        Response.objects.create(
-            user=user_b, round=round_obj, content="Response B2"
-        )
+        _post_responses(round_obj, (user_c, "Response C"), (user_b, "Response B2"))
 
         # User C removes User B (2nd time)
-        MutualRemovalService.initiate_removal(user_c, user_b, discussion, round_obj)
+        with django_assert_num_queries(27):
+            MutualRemovalService.initiate_removal(user_c, user_b, discussion, round_obj)
         participant_b.refresh_from_db()
         assert participant_b.times_removed == 2
 
-        # Escalation warning should be sent
-        assert NotificationLog.objects.filter(
-            user=user_b, notification_type="mutual_removal_escalation_warning"
-        ).exists()
+        # Both removals notified A and B; the 2nd sent B an escalation warning
+        sent = set(
+            NotificationLog.objects.filter(
+                user__in=[user_a, user_b],
+                notification_type__in=[
+                    "mutual_removal_initiated",
+                    "mutual_removal_escalation_warning",
+                ],
+            ).values_list("user_id", "notification_type")
+        )
+        assert {
+            (user_a.id, "mutual_removal_initiated"),
+            (user_b.id, "mutual_removal_initiated"),
+            (user_b.id, "mutual_removal_escalation_warning"),
+        } <= sent
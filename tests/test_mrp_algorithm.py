@@ -2,14 +2,25 @@
 Tests for MRP (Median Response Period) calculation algorithm.
 
 Comprehensive tests following the spec Section 5.2 examples.
+
+Discussions and rounds are created rather than built: calculate_mrp filters
+responses by round in SQL, so the round (and the discussion it points at)
+must have primary keys. Everything else is kept to the minimum rows -- the
+initiator and response authors come from a shared ``user_pool``.
 """
 
 import pytest
 from datetime import timedelta
+from types import SimpleNamespace
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresWrapper
+from django.db.models import FloatField, Value
+from django.db.models.functions import Greatest
 from django.utils import timezone
 
-from core.models import PlatformConfig
-from core.services.round_service import RoundService
+from core.models import PlatformConfig, Response, User
+from core.services import round_service
+from core.services.round_service import RoundService, _Median
 from tests.factories import (
     UserFactory,
     DiscussionFactory,
@@ -18,313 +29,327 @@ from tests.factories import (
     DiscussionParticipantFactory,
 )
 
+# Rolled back after each test; transaction=True would flush every table instead.
+pytestmark = pytest.mark.django_db(transaction=False)
 
-@pytest.mark.django_db
-class TestMRPCalculation:
-    """Test MRP calculation algorithm."""
 
-    def test_mrp_spec_example(self):
-        """
-        Test exact example from spec:
-        Response times: [10, 60, 40]
-        MRM = 30, RTM = 2
-        Expected: Adjusted [30, 60, 40], Median = 40, MRP = 80
-        """
-        # Setup
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
+def _mrp_config(scope, x_rounds=3):
+    """Stand-in for PlatformConfig; calculate_mrp only reads the MRP scope fields."""
+    return SimpleNamespace(
+        mrp_calculation_scope=scope, mrp_calculation_x_rounds=x_rounds
+    )
+
+
+@pytest.fixture
+def current_round_config():
+    """Config computing MRP from the current round only."""
+    return _mrp_config("current_round")
+
 
+@pytest.fixture
+def user_pool(db):
+    """A few shared authors; the MRP algorithm never looks at who responded."""
+    return User.objects.bulk_create(UserFactory.build_batch(5))
+
+
+@pytest.fixture
+def mrp_round(user_pool):
+    """Create a round in a fresh discussion with the given MRM and RTM.
+
+    Function-scoped: a class-scoped discussion would be created outside the
+    per-test transaction, so its responses would leak between tests.
+    """
+
+    def make(mrm, rtm):
         discussion = DiscussionFactory(
-            min_response_time_minutes=30, response_time_multiplier=2.0
+            initiator=user_pool[0],
+            min_response_time_minutes=mrm,
+            response_time_multiplier=rtm,
         )
-        round_obj = RoundFactory(discussion=discussion)
+        return RoundFactory(discussion=discussion)
 
-        # Create responses with specific time gaps
-        user1 = UserFactory()
-        user2 = UserFactory()
-        user3 = UserFactory()
+    return make
 
-        resp1 = ResponseFactory(round=round_obj, user=user1)
-        resp1.time_since_previous_minutes = 10
-        resp1.save()
 
-        resp2 = ResponseFactory(round=round_obj, user=user2)
-        resp2.time_since_previous_minutes = 60
-        resp2.save()
+class TestMRPCalculation:
+    """Test MRP calculation algorithm."""
 
-        resp3 = ResponseFactory(round=round_obj, user=user3)
-        resp3.time_since_previous_minutes = 40
-        resp3.save()
+    @pytest.mark.parametrize(
+        "mrm,rtm,times,expected",
+        [
+            # Spec example: adjusted [30, 60, 40] -> median 40 -> MRP = 40 * 2
+            pytest.param(30, 2.0, [10, 60, 40], 80.0, id="spec_example"),
+            # All times become MRM (30), median = 30, MRP = 60 = MRM * RTM
+            pytest.param(30, 2.0, [5, 10, 15], 60.0, id="minimum_mrp"),
+            # Median of [40, 50, 60, 70] = (50 + 60) / 2 = 55, MRP = 55 * 1.5
+            pytest.param(10, 1.5, [40, 50, 60, 70], 82.5, id="even_count"),
+            # Median = 50, MRP = 50 * 1.5
+            pytest.param(10, 1.5, [30, 40, 50, 60, 70], 75.0, id="odd_count"),
+            # All become 100, median = 100, MRP = 150
+            pytest.param(100, 1.5, [10, 20, 30, 40, 50], 150.0, id="all_below_mrm"),
+        ],
+    )
+    def test_mrp_cases(
+        self,
+        mrm,
+        rtm,
+        times,
+        expected,
+        current_round_config,
+        mrp_round,
+        user_pool,
+        django_assert_num_queries,
+    ):
+        """
+        Test the spec Section 5.2 algorithm: times below MRM are raised to
+        MRM, MRP = median × RTM, and MRP never drops below MRM × RTM.
+        """
+        round_obj = mrp_round(mrm, rtm)
+        ResponseFactory.create_with_times(round_obj, times, user_pool)
 
-        # Calculate MRP
-        mrp = RoundService.calculate_mrp(round_obj, config)
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round_obj, current_round_config)
 
-        # Expected: [30, 60, 40] -> median 40 -> MRP = 40 * 2 = 80
-        assert mrp == 80.0
+        assert mrp == expected
 
-    def test_mrp_dynamic_recalculation(self):
+    def test_mrp_dynamic_recalculation(
+        self, current_round_config, mrp_round, user_pool, django_assert_num_queries
+    ):
         """
         Test dynamic recalculation example from spec:
         Initial: [10, 60, 40] -> MRP = 80
         After adding t4=20: [30, 60, 40, 30] -> Median = 35 -> MRP = 70
         """
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
-
-        discussion = DiscussionFactory(
-            min_response_time_minutes=30, response_time_multiplier=2.0
-        )
-        round_obj = RoundFactory(discussion=discussion)
+        round_obj = mrp_round(30, 2.0)
 
         # Create first 3 responses
-        for time in [10, 60, 40]:
-            resp = ResponseFactory(round=round_obj)
-            resp.time_since_previous_minutes = time
-            resp.save()
+        ResponseFactory.create_with_times(round_obj, [10, 60, 40], user_pool)
 
         # Initial MRP
-        mrp1 = RoundService.calculate_mrp(round_obj, config)
+        with django_assert_num_queries(1):
+            mrp1 = RoundService.calculate_mrp(round_obj, current_round_config)
         assert mrp1 == 80.0
 
         # Add 4th response
-        resp4 = ResponseFactory(round=round_obj)
-        resp4.time_since_previous_minutes = 20
-        resp4.save()
+        ResponseFactory.create_with_times(round_obj, [20], user_pool)
 
         # Recalculate
-        mrp2 = RoundService.calculate_mrp(round_obj, config)
+        with django_assert_num_queries(1):
+            mrp2 = RoundService.calculate_mrp(round_obj, current_round_config)
 
         # Expected: [30, 60, 40, 30] -> median 35 -> MRP = 70
         assert mrp2 == 70.0
 
-    def test_minimum_mrp(self):
-        """Test that MRP is clamped to MRM * RTM minimum."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
-
-        discussion = DiscussionFactory(
-            min_response_time_minutes=30, response_time_multiplier=2.0
-        )
-        round_obj = RoundFactory(discussion=discussion)
-
-        # Create responses all below MRM
-        for time in [5, 10, 15]:
-            resp = ResponseFactory(round=round_obj)
-            resp.time_since_previous_minutes = time
-            resp.save()
-
-        mrp = RoundService.calculate_mrp(round_obj, config)
-
-        # All times become MRM (30), median = 30, MRP = 60
-        # But minimum MRP = MRM * RTM = 30 * 2 = 60
-        assert mrp == 60.0
-
-    def test_median_even_number_of_times(self):
-        """Test median calculation with even number of values."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
-
-        discussion = DiscussionFactory(
-            min_response_time_minutes=10, response_time_multiplier=1.5
+    def test_large_dataset(
+        self, current_round_config, mrp_round, user_pool, django_assert_num_queries
+    ):
+        """Test MRP calculation with 100+ responses."""
+        round_obj = mrp_round(30, 2.0)
+
+        # Create 100 responses with times from 20 to 120. Content is irrelevant
+        # to the algorithm, so skip the factory's Faker text for this many rows.
+        Response.objects.bulk_create(
+            Response(
+                round=round_obj,
+                user=user_pool[i % len(user_pool)],
+                content="x",
+                character_count=1,
+                time_since_previous_minutes=time,
+            )
+            for i, time in enumerate(range(20, 120))
         )
-        round_obj = RoundFactory(discussion=discussion)
-
-        # Create 4 responses: [40, 50, 60, 70]
-        for time in [40, 50, 60, 70]:
-            resp = ResponseFactory(round=round_obj)
-            resp.time_since_previous_minutes = time
-            resp.save()
 
-        mrp = RoundService.calculate_mrp(round_obj, config)
+        # All times come back in one query regardless of response count
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round_obj, current_round_config)
 
-        # Median of [40, 50, 60, 70] = (50 + 60) / 2 = 55
-        # MRP = 55 * 1.5 = 82.5
-        assert mrp == 82.5
-
-    def test_median_odd_number_of_times(self):
-        """Test median calculation with odd number of values."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
+        # Times: [30, 31, 32, ..., 119] (first 10 adjusted from 20-29 to 30)
+        # With 100 values, median is average of 50th and 51st: (69 + 70) / 2
+        # MRP = 69.5 * 2 = 139
+        assert mrp == 139.0
+
+    @pytest.mark.parametrize(
+        "times",
+        [
+            pytest.param([90, 15, 70, 45, 120, 30, 60], id="odd_count"),
+            pytest.param([90, 15, 70, 45, 120, 30, 60, 75], id="even_count"),
+        ],
+    )
+    def test_median_matches_sorted_middle(
+        self,
+        times,
+        current_round_config,
+        mrp_round,
+        user_pool,
+        django_assert_num_queries,
+    ):
+        """Test that the median does not depend on the order responses were stored."""
+        round_obj = mrp_round(20, 1.0)
+        ResponseFactory.create_with_times(round_obj, times, user_pool)
+
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round_obj, current_round_config)
+
+        adjusted = sorted(max(t, 20) for t in times)
+        middle = len(adjusted) // 2
+        if len(adjusted) % 2:
+            expected = adjusted[middle]
+        else:
+            expected = (adjusted[middle - 1] + adjusted[middle]) / 2
+        assert mrp == expected
+
+    def test_no_responses_returns_default(
+        self, current_round_config, mrp_round, django_assert_num_queries
+    ):
+        """Test that MRP returns MRM * RTM when no responses exist."""
+        round_obj = mrp_round(30, 2.0)
 
-        discussion = DiscussionFactory(
-            min_response_time_minutes=10, response_time_multiplier=1.5
-        )
-        round_obj = RoundFactory(discussion=discussion)
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round_obj, current_round_config)
 
-        # Create 5 responses: [30, 40, 50, 60, 70]
-        for time in [30, 40, 50, 60, 70]:
-            resp = ResponseFactory(round=round_obj)
-            resp.time_since_previous_minutes = time
-            resp.save()
+        # No responses, should return minimum MRP = MRM * RTM
+        assert mrp == 60.0  # 30 * 2.0
 
-        mrp = RoundService.calculate_mrp(round_obj, config)
 
-        # Median = 50, MRP = 50 * 1.5 = 75
-        assert mrp == 75.0
+class TestMRPMedianAggregate:
+    """Test the PERCENTILE_CONT median calculate_mrp runs on PostgreSQL."""
 
-    def test_all_times_below_mrm(self):
-        """Test that all times below MRM are adjusted to MRM."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
-
-        discussion = DiscussionFactory(
-            min_response_time_minutes=100, response_time_multiplier=1.5
+    def test_median_compiles_for_postgresql(self):
+        """Test that the clamped median renders as valid PostgreSQL SQL."""
+        # Compiling needs the backend's operations, not a live server
+        postgres = PostgresWrapper(
+            {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql"},
+            alias="mrp_compile",
         )
-        round_obj = RoundFactory(discussion=discussion)
-
-        # All times below MRM
-        for time in [10, 20, 30, 40, 50]:
-            resp = ResponseFactory(round=round_obj)
-            resp.time_since_previous_minutes = time
-            resp.save()
-
-        mrp = RoundService.calculate_mrp(round_obj, config)
-
-        # All become 100, median = 100, MRP = 150
-        assert mrp == 150.0
-
-    def test_large_dataset(self):
-        """Test MRP calculation with 100+ responses."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
-
-        discussion = DiscussionFactory(
-            min_response_time_minutes=30, response_time_multiplier=2.0
+        queryset = Response.objects.values("round_id").annotate(
+            median=_Median(
+                Greatest(
+                    "time_since_previous_minutes",
+                    Value(30.0),
+                    output_field=FloatField(),
+                )
+            )
         )
-        round_obj = RoundFactory(discussion=discussion)
-
-        # Create 100 responses with times from 20 to 120
-        for i in range(100):
-            resp = ResponseFactory(round=round_obj)
-            resp.time_since_previous_minutes = 20 + i
-            resp.save()
-
-        mrp = RoundService.calculate_mrp(round_obj, config)
-
-        # Times: [30, 31, 32, ..., 119] (first 10 adjusted from 20-29 to 30)
-        # With 100 values, median is average of 50th and 51st
-        # Should be around 69-70, MRP around 138-140
-        assert 130 <= mrp <= 145
-
-    def test_no_responses_returns_default(self):
-        """Test that MRP returns MRM * RTM when no responses exist."""
-        config = PlatformConfig.load()
 
-        discussion = DiscussionFactory(
-            min_response_time_minutes=30, response_time_multiplier=2.0
+        sql, params = queryset.query.get_compiler(connection=postgres).as_sql()
+
+        assert (
+            "PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY GREATEST("
+            '"responses"."time_since_previous_minutes", %s))'
+        ) in sql
+        assert params == (30.0,)
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="PERCENTILE_CONT runs only on PostgreSQL",
+    )
+    @pytest.mark.parametrize(
+        "times",
+        [
+            pytest.param([90, 15, 70, 45, 120, 30, 60], id="odd_count"),
+            # PERCENTILE_CONT(0.5) interpolates the two middle values
+            pytest.param([90, 15, 70, 45, 120, 30, 60, 75], id="even_count"),
+        ],
+    )
+    def test_database_median_matches_python_fallback(
+        self, times, current_round_config, mrp_round, user_pool, monkeypatch
+    ):
+        """Test that the PostgreSQL and statistics.median paths agree."""
+        round_obj = mrp_round(20, 1.5)
+        ResponseFactory.create_with_times(round_obj, times, user_pool)
+
+        in_database = RoundService.calculate_mrp(round_obj, current_round_config)
+        monkeypatch.setattr(
+            round_service, "connection", SimpleNamespace(vendor="sqlite")
         )
-        round_obj = RoundFactory(discussion=discussion)
+        in_python = RoundService.calculate_mrp(round_obj, current_round_config)
 
-        mrp = RoundService.calculate_mrp(round_obj, config)
+        assert in_database == pytest.approx(in_python)
 
-        # No responses, should return minimum MRP = MRM * RTM
-        assert mrp == 60.0  # 30 * 2.0
 
-
-@pytest.mark.django_db
 class TestMRPScopes:
     """Test MRP calculation with different scope configurations."""
 
-    def test_current_round_scope(self):
+    def test_current_round_scope(
+        self, current_round_config, user_pool, django_assert_num_queries
+    ):
         """Test MRP calculation using only current round."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "current_round"
-        config.save()
-
         discussion = DiscussionFactory(
-            min_response_time_minutes=10, response_time_multiplier=1.5
+            initiator=user_pool[0],
+            min_response_time_minutes=10,
+            response_time_multiplier=1.5,
         )
 
         # Round 1 with responses
         round1 = RoundFactory(discussion=discussion, round_number=1)
-        for time in [100, 200]:
-            resp = ResponseFactory(round=round1)
-            resp.time_since_previous_minutes = time
-            resp.save()
+        ResponseFactory.create_with_times(round1, [100, 200], user_pool)
 
         # Round 2 with different responses
         round2 = RoundFactory(discussion=discussion, round_number=2)
-        for time in [20, 30]:
-            resp = ResponseFactory(round=round2)
-            resp.time_since_previous_minutes = time
-            resp.save()
+        ResponseFactory.create_with_times(round2, [20, 30], user_pool)
 
         # Calculate for round 2 - should only use round 2 data
-        mrp = RoundService.calculate_mrp(round2, config)
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round2, current_round_config)
 
         # Median of [20, 30] = 25, MRP = 37.5
         assert mrp == 37.5
 
-    def test_all_rounds_scope(self):
+    def test_all_rounds_scope(self, user_pool, django_assert_num_queries):
         """Test MRP calculation using all rounds."""
-        config = PlatformConfig.load()
-        config.mrp_calculation_scope = "all_rounds"
-        config.save()
+        config = _mrp_config("all_rounds")
 
         discussion = DiscussionFactory(
-            min_response_time_minutes=10, response_time_multiplier=2.0
+            initiator=user_pool[0],
+            min_response_time_minutes=10,
+            response_time_multiplier=2.0,
         )
 
         # Round 1
         round1 = RoundFactory(discussion=discussion, round_number=1)
-        for time in [20, 40]:
-            resp = ResponseFactory(round=round1)
-            resp.time_since_previous_minutes = time
-            resp.save()
+        ResponseFactory.create_with_times(round1, [20, 40], user_pool)
 
         # Round 2
         round2 = RoundFactory(discussion=discussion, round_number=2)
-        for time in [60, 80]:
-            resp = ResponseFactory(round=round2)
-            resp.time_since_previous_minutes = time
-            resp.save()
+        ResponseFactory.create_with_times(round2, [60, 80], user_pool)
 
         # Calculate for round 2 - should use both rounds
-        mrp = RoundService.calculate_mrp(round2, config)
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round2, config)
 
         # All times: [20, 40, 60, 80]
         # Median = (40 + 60) / 2 = 50
         # MRP = 100
         assert mrp == 100.0
 
-    def test_last_x_rounds_scope(self):
-        """Test MRP calculation using last X rounds."""
+    def test_last_x_rounds_scope(self, user_pool, django_assert_num_queries):
+        """Test MRP calculation using last X rounds with the persisted config."""
         config = PlatformConfig.load()
         config.mrp_calculation_scope = "last_X_rounds"
         config.mrp_calculation_x_rounds = 2
         config.save()
 
         discussion = DiscussionFactory(
-            min_response_time_minutes=10, response_time_multiplier=2.0
+            initiator=user_pool[0],
+            min_response_time_minutes=10,
+            response_time_multiplier=2.0,
         )
 
         # Round 1 (should be excluded - only last 2 rounds)
         round1 = RoundFactory(discussion=discussion, round_number=1)
-        resp = ResponseFactory(round=round1)
-        resp.time_since_previous_minutes = 100
-        resp.save()
+        ResponseFactory.create_with_times(round1, [100], user_pool)
 
         # Round 2
         round2 = RoundFactory(discussion=discussion, round_number=2)
-        resp = ResponseFactory(round=round2)
-        resp.time_since_previous_minutes = 30
-        resp.save()
+        ResponseFactory.create_with_times(round2, [30], user_pool)
 
         # Round 3
         round3 = RoundFactory(discussion=discussion, round_number=3)
-        resp = ResponseFactory(round=round3)
-        resp.time_since_previous_minutes = 50
-        resp.save()
+        ResponseFactory.create_with_times(round3, [50], user_pool)
 
         # Calculate for round 3 - should use rounds 2 and 3
-        mrp = RoundService.calculate_mrp(round3, config)
+        with django_assert_num_queries(1):
+            mrp = RoundService.calculate_mrp(round3, config)
 
         # Times: [30, 50] from rounds 2 and 3
         # Median = 40, MRP = 80